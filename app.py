@@ -2,6 +2,7 @@ from flask import Flask, render_template, request
 import os 
 import numpy as np
 import pandas as pd
+from src.datascience import configure_logging
 from src.datascience.pipeline.prediction_pipeline import PredictionPipeline
 
 
@@ -53,5 +54,6 @@ def index():
 
 
 if __name__ == "__main__":
+	configure_logging()
 	
 	app.run(host="0.0.0.0", port = 8080)
\ No newline at end of file
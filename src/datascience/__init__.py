@@ -1,27 +1,129 @@
 import os
 import sys
+import copy
+import time
+import queue
+import atexit
 import logging
+import logging.handlers
 
 logging_str="[%(asctime)s: %(levelname)s: %(module)s: %(message)s]"
 #
 
-log_dir="logs"
-log_filepath=os.path.join(log_dir,"logging.log")
-os.makedirs(log_dir,exist_ok=True)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format=logging_str,
-    #it will print the logging in the file
-   
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that writes through an 8 KiB buffer and only flushes
+    every `flush_every` records, or right away for WARNING and above."""
 
-    handlers=[
-        logging.FileHandler(log_filepath),
-        logging.StreamHandler(sys.stdout)
-        #it will print the logging in the console
+    flush_every=64
+
+    def __init__(self,filename,mode="a",encoding="utf-8",delay=False,errors=None):
+        self._pending=0
+        super().__init__(filename,mode=mode,encoding=encoding,delay=delay,errors=errors)
+
+    def _open(self):
+        return open(self.baseFilename,self.mode,buffering=8192,
+                    encoding=self.encoding,errors=self.errors)
+
+    def emit(self,record):
+        if self.stream is None:
+            if self.mode!="w" or not self._closed:
+                self.stream=self._open()
+        if self.stream is None:
+            return
+        try:
+            self.stream.write(self.format(record)+self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+            return
+        self._pending+=1
+        if record.levelno>=logging.WARNING or self._pending>=self.flush_every:
+            self.flush()
+
+    def flush(self):
+        # logging.shutdown() also ends up here, so nothing buffered is lost on exit
+        super().flush()
+        self._pending=0
+
+
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for a queue that stays in this process.
+
+    The stock prepare() formats the record and folds the traceback into
+    the message so it can be pickled, which puts the traceback inside the
+    [...] of logging_str. Here only the message is fixed (args may change
+    after the call) and exc_info is left for the listener's formatter.
+    """
+
+    def prepare(self,record):
+        record=copy.copy(record)
+        record.msg=record.getMessage()
+        record.args=None
+        return record
+
+
+class FastFormatter(logging.Formatter):
+    """Formatter that formats the date and time once per second, records
+    logged in the same second reuse it and only add their milliseconds."""
+
+    def __init__(self,*args,**kwargs):
+        super().__init__(*args,**kwargs)
+        self._last_time=(None,"")
+
+    def formatTime(self,record,datefmt=None):
+        if datefmt:
+            return super().formatTime(record,datefmt)
+        seconds=int(record.created)
+        last_seconds,last_str=self._last_time
+        if seconds!=last_seconds:
+            last_str=time.strftime(self.default_time_format,self.converter(seconds))
+            self._last_time=(seconds,last_str)
+        return self.default_msec_format%(last_str,record.msecs)
+
+
+_configured=False
+
+
+def configure_logging(log_dir="logs"):
+    """send log records to logs/logging.log and the console.
+
+    Called by the entry points (main.py, template.py, the pipeline
+    scripts), importing the package alone leaves global logging alone.
+    Only the first call has an effect.
+    """
+    global _configured
+    if _configured:
+        return
+    _configured=True
+
+    log_filepath=os.path.join(log_dir,"logging.log")
+    os.makedirs(log_dir,exist_ok=True)
+
+    formatter=FastFormatter(logging_str)
+
+    file_handler=BufferedFileHandler(log_filepath)
+    #it will print the logging in the file
+    stream_handler=logging.StreamHandler(sys.stdout)
+    #it will print the logging in the console
+    for handler in (file_handler,stream_handler):
+        handler.setFormatter(formatter)
+
+    # logging calls only put the record on a queue, a background listener
+    # thread does the file and console writes so callers never wait on I/O
+    log_queue=queue.Queue(-1)
+    root_logger=logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(LocalQueueHandler(log_queue))
+
+    log_listener=logging.handlers.QueueListener(
+        log_queue,file_handler,stream_handler,respect_handler_level=True
+    )
+    log_listener.start()
+    # drain the queue before the interpreter exits
+    atexit.register(log_listener.stop)
 
-    ]
-)
 
 logger=logging.getLogger("datasciencelogger")
 """Perfect question 👌 You don’t just want to know *what* the code is doing, but also *why*, *when*, and *what happens if you don’t use it*. Let’s break it down in plain terms.
@@ -1,33 +1,47 @@
 import os
+import csv
 from src.datascience import logger
 import pandas as pd
+from pydantic import ValidationError
 
 from src.datascience.entity.config_entity import DataValidationConfig
+from src.datascience.entity.schema_model import rows_adapter
 
 
 class DataValiadtion:
     def __init__(self, config: DataValidationConfig):
         self.config = config
 
+    def read_header(self) -> list:
+        """column names from the first line of the csv, without parsing the rest"""
+        # utf-8-sig drops a BOM the same way pandas does
+        with open(self.config.unzip_data_dir, newline="", encoding="utf-8-sig") as f:
+            return next(csv.reader(f), [])
+
     def validate_all_columns(self)-> bool:
         try:
-            validation_status = None
-
-            data = pd.read_csv(self.config.unzip_data_dir)
-            all_cols = list(data.columns)
-
-            all_schema = self.config.all_schema.keys()
-
-            
-            for col in all_cols:
-                if col not in all_schema:
+            # the header line is enough to check the column names
+            expected = self.config.schema_columns
+            actual = frozenset(self.read_header())
+            missing = expected - actual
+            extra = actual - expected
+            validation_status = not missing and not extra
+            if missing:
+                logger.info("columns missing from data: %s", sorted(missing))
+            if extra:
+                logger.info("columns not in schema: %s", sorted(extra))
+
+            if validation_status:
+                adapter = rows_adapter(tuple(self.config.all_schema.items()))
+                data = pd.read_csv(self.config.unzip_data_dir)
+                try:
+                    adapter.validate_python(data.to_dict(orient="records"))
+                except ValidationError as e:
+                    logger.info("data does not match the schema: %s", e.errors(include_url=False)[:5])
                     validation_status = False
-                    with open(self.config.STATUS_FILE, 'w') as f:
-                        f.write(f"Validation status: {validation_status}")
-                else:
-                    validation_status = True
-                    with open(self.config.STATUS_FILE, 'w') as f:
-                        f.write(f"Validation status: {validation_status}")
+
+            with open(self.config.STATUS_FILE, 'w') as f:
+                f.write(f"Validation status: {validation_status}")
 
             return validation_status
         
@@ -5,11 +5,11 @@ from urllib.parse import urlparse
 import mlflow
 import mlflow.sklearn
 import numpy as np
-import joblib
+from sklearn.linear_model import ElasticNet
 
 from src.datascience.entity.config_entity import ModelEvaluationConfig
 from src.datascience.constants import *
-from src.datascience.utils.common import read_yaml, create_directories,save_json
+from src.datascience.utils.common import read_yaml, create_directories,save_json,load_estimator
 
 
 
@@ -26,7 +26,10 @@ class ModelEvaluation:
     
     def log_into_mlflow(self):
         test_data = pd.read_csv(self.config.test_data_path)
-        model = joblib.load(self.config.model_path)
+        params = self.config.all_params
+        model = load_estimator(
+            ElasticNet(alpha=params.alpha, l1_ratio=params.l1_ratio, random_state=42), self.config.model_path
+        )
 
         test_x = test_data.drop([self.config.target_column], axis=1)
         test_y = test_data[[self.config.target_column]]
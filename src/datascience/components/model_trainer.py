@@ -2,7 +2,7 @@ import pandas as pd
 import os
 from src.datascience import logger
 from sklearn.linear_model import ElasticNet
-import joblib
+from src.datascience.utils.common import save_estimator
 
 from src.datascience.entity.config_entity import ModelTrainerConfig
 
@@ -25,7 +25,7 @@ class ModelTrainer:
         lr = ElasticNet(alpha=self.config.alpha, l1_ratio=self.config.l1_ratio, random_state=42)
         lr.fit(train_x, train_y)
 
-        joblib.dump(lr, os.path.join(self.config.root_dir, self.config.model_name))
+        save_estimator(lr, os.path.join(self.config.root_dir, self.config.model_name))
 
 
     
\ No newline at end of file
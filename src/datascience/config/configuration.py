@@ -1,3 +1,5 @@
+import functools
+
 from src.datascience.constants import *
 from src.datascience.utils.common import read_yaml, create_directories
 
@@ -41,6 +43,7 @@ class ConfigurationManager:
             STATUS_FILE=config.STATUS_FILE,
             unzip_data_dir = config.unzip_data_dir,
             all_schema=schema,
+            schema_columns=frozenset(schema),
         )
 
         return data_validation_config
@@ -92,4 +95,16 @@ class ConfigurationManager:
 
 
         )
-        return model_evaluation_config
\ No newline at end of file
+        return model_evaluation_config
+
+
+@functools.lru_cache(maxsize=1)
+def get_config_manager() -> ConfigurationManager:
+    """ConfigurationManager for the default config files, shared by every
+    pipeline stage so the yaml files are only read once per process"""
+    return ConfigurationManager()
+
+
+def reset_config_manager() -> None:
+    """forget the shared ConfigurationManager, for tests that change the config files"""
+    get_config_manager.cache_clear()
@@ -15,6 +15,7 @@ class DataValidationConfig:
     STATUS_FILE:str
     unzip_data_dir:Path
     all_schema:dict
+    schema_columns:frozenset
 
 @dataclass
 class DataTransformationConfig:
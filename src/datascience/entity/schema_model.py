@@ -0,0 +1,34 @@
+import functools
+
+import numpy as np
+from pydantic import ConfigDict, Field, TypeAdapter, create_model
+
+
+# numpy dtype kind in schema.yaml -> python type pydantic validates against
+_KIND_TO_TYPE = {"f": float, "i": int, "u": int, "b": bool, "U": str, "O": str}
+
+
+@functools.lru_cache
+def rows_adapter(columns: tuple[tuple[str, str], ...]) -> TypeAdapter:
+    """TypeAdapter validating a list of row dicts against schema columns
+
+    Built from the COLUMNS section of schema.yaml as (name, dtype) pairs,
+    the model is only compiled once per distinct schema.
+
+    Raises:
+        ValueError: if a column has a dtype with no pydantic equivalent
+    """
+    fields = {}
+    for name, dtype in columns:
+        kind = np.dtype(dtype).kind
+        if kind not in _KIND_TO_TYPE:
+            raise ValueError(f"unsupported dtype {dtype} for column {name}")
+        # column names like "fixed acidity" aren't identifiers, keep them as aliases
+        fields[name.replace(" ", "_")] = (_KIND_TO_TYPE[kind], Field(alias=name))
+
+    row_model = create_model(
+        "WineSchema",
+        __config__=ConfigDict(populate_by_name=True, allow_inf_nan=False),
+        **fields,
+    )
+    return TypeAdapter(list[row_model])
@@ -1,6 +1,6 @@
-from src.datascience.config.configuration import ConfigurationManager
+from src.datascience.config.configuration import get_config_manager
 from src.datascience.components.data_ingestion import DataIngestion
-from src.datascience import logger
+from src.datascience import logger, configure_logging
 
 
 STAGE_NAME="Data Ingestion Stage"
@@ -10,7 +10,7 @@ class DataIngestionTrainingPipeline:
         pass
 
     def initiate_data_ingestion(self):
-        config=ConfigurationManager()
+        config=get_config_manager()
         data_ingestion_config=config.get_data_ingestion_config()
         data_ingestion=DataIngestion(config=data_ingestion_config)
         data_ingestion.download_file()
@@ -18,6 +18,7 @@ class DataIngestionTrainingPipeline:
 
 
 if __name__ == '__main__':
+    configure_logging()
     try:
         logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
         obj = DataIngestionTrainingPipeline()
@@ -1,4 +1,4 @@
-from src.datascience.config.configuration import ConfigurationManager
+from src.datascience.config.configuration import get_config_manager
 from src.datascience.components.data_transformation import DataTransformation
 from src.datascience import logger
 
@@ -17,7 +17,7 @@ class DataTransformationTrainingPipeline:
             with open(Path("artifacts/data_validation/status.txt"),'r') as f:
                 status=f.read().split(" ")[-1]
             if status=="True":
-                config=ConfigurationManager()
+                config=get_config_manager()
                 data_transformation_config=config.get_data_transformation_config()
                 data_transformation=DataTransformation(config=data_transformation_config)
                 data_transformation.train_test_splitting()
@@ -1,6 +1,6 @@
-from src.datascience.config.configuration import ConfigurationManager
+from src.datascience.config.configuration import get_config_manager
 from src.datascience.components.data_validation import DataValiadtion
-from src.datascience import logger
+from src.datascience import logger, configure_logging
 
 STAGE_NAME = "Data Validation stage"
 
@@ -9,7 +9,7 @@ class DataValidationTrainingPipeline:
         pass
 
     def initiate_data_validation(self):
-        config = ConfigurationManager()
+        config = get_config_manager()
         data_validation_config = config.get_data_validation_config()
         data_validation = DataValiadtion(config=data_validation_config)
         data_validation.validate_all_columns()
@@ -22,11 +22,12 @@ class DataValidationTrainingPipeline:
 # it will also return the status of the validation in the status.txt file
 
 if __name__ == '__main__':
+    configure_logging()
     try:
-        logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
+        logger.info(">>>>>> stage %s started <<<<<<", STAGE_NAME)
         obj = DataValidationTrainingPipeline()
         obj.initiate_data_validation()
-        logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+        logger.info(">>>>>> stage %s completed <<<<<<\n\nx==========x", STAGE_NAME)
     except Exception as e:
         logger.exception(e)
         raise e
\ No newline at end of file
@@ -1,4 +1,4 @@
-from src.datascience.config.configuration import ConfigurationManager
+from src.datascience.config.configuration import get_config_manager
 from src.datascience.components.model_evaluation import ModelEvaluation
 from src.datascience import logger
 
@@ -9,7 +9,7 @@ class ModelEvaluationTrainingPipeline:
         pass
 
     def initiate_model_evaluation(self):
-        config = ConfigurationManager()
+        config = get_config_manager()
         model_evaluation_config = config.get_model_evaluation_config()
         model_evaluation = ModelEvaluation(config=model_evaluation_config)
         model_evaluation.log_into_mlflow()
\ No newline at end of file
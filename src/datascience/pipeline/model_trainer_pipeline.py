@@ -1,4 +1,4 @@
-from src.datascience.config.configuration import ConfigurationManager
+from src.datascience.config.configuration import get_config_manager
 from src.datascience.components.model_trainer import ModelTrainer
 from src.datascience import logger
 
@@ -10,7 +10,7 @@ class ModelTrainerTrainingPipeline:
         pass
 
     def initiate_model_training(self):
-        config = ConfigurationManager()
+        config = get_config_manager()
         model_trainer_config = config.get_model_trainer_config()
         model_trainer_config = ModelTrainer(config=model_trainer_config)
         model_trainer_config.train()
\ No newline at end of file
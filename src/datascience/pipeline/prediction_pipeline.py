@@ -1,12 +1,21 @@
-import joblib
 import numpy as np
 import pandas as pd
 from pathlib import Path
+from sklearn.linear_model import ElasticNet
+
+from src.datascience.config.configuration import get_config_manager
+from src.datascience.utils.common import load_estimator
 
 
 class PredictionPipeline:
     def __init__(self):
-        self.model=joblib.load(Path('artifacts/model_trainer/model.joblib'))
+        # the artifact only holds the fitted arrays, rebuild the estimator
+        # from the same params the trainer used and load them onto it
+        config=get_config_manager().get_model_trainer_config()
+        self.model=load_estimator(
+            ElasticNet(alpha=config.alpha, l1_ratio=config.l1_ratio, random_state=42),
+            Path(config.root_dir) / config.model_name,
+        )
 
     def predict(self,data):
         prediction=self.model.predict(data)
@@ -0,0 +1,86 @@
+import os
+from pathlib import Path
+
+from src.datascience import logger, configure_logging
+
+project_name="datascience"
+
+# every file the project skeleton is made of, relative to the repo root
+SCAFFOLD: tuple[str, ...]=(
+    ".github/workflows/.gitkeep",
+    # for the github actions 
+    # .gitkeep is used for the deployment
+    f"src/{project_name}/__init__.py",
+    # for the initialization of the project
+    # to import anywhere w are using __init__.py , 
+    # so It acts like a pakage 
+    f"src/{project_name}/components/__init__.py",
+    # Enitre pipline is developed in one single folder or directory
+    # which is our component folder
+    # __init .py is for again to import it anywhere
+    
+    f"src/{project_name}/utils/__init__.py",
+    #funcanality which is generic we use it  for that
+    f"src/{project_name}/utils/common.py",
+    # this utils folder have a file name common.py
+    # which contain all the commaon fucntions that are used in the project
+    f"src/{project_name}/config/__init__.py",
+    
+    f"src/{project_name}/config/configuration.py",
+    # this config folder have a file name configuration.py
+    # which contain all the configuration that are used in the project
+    f"src/{project_name}/pipeline/__init__.py",
+    # all the different piple , all the traning and testting or inferencing pipelines
+    f"src/{project_name}/entity/__init__.py",
+    
+    f"src/{project_name}/entity/config_entity.py",
+    f"src/{project_name}/constants/__init__.py",
+    "config/config.yaml",# all config details are in this file
+    "params.yaml",  # all params details are in this file
+    "schema.yaml", # all schema details are in this file
+    # I am using this yml file because it is easy to read and write
+    # and it is easy to understand and it is in key value pair format
+    "main.py",
+    "Dockerfile",
+    "setup.py",
+    "research/research.ipynb",
+    #
+    "templates/index.html",
+    "app.py",
+)
+
+
+def main():
+    """create the directories and empty placeholder files listed in SCAFFOLD,
+    files that already have content are left alone"""
+    # dict.fromkeys drops repeated entries and keeps the order
+    files=[Path(filepath) for filepath in dict.fromkeys(SCAFFOLD)]
+
+    # the directories are known up front, create each one once
+    parents={filepath.parent for filepath in files if filepath.parent!=Path(".")}
+    for filedir in parents:
+        os.makedirs(filedir,exist_ok=True)
+        logger.info("Creating directory %s",filedir)
+
+    # one scandir per directory instead of os.path.exists + getsize per file
+    wanted={}
+    for filepath in files:
+        wanted.setdefault(filepath.parent,set()).add(filepath.name)
+
+    existing={}
+    for filedir,names in wanted.items():
+        with os.scandir(filedir) as entries:
+            existing[filedir]={e.name:e.stat().st_size for e in entries if e.name in names}
+
+    for filepath in files:
+        if existing[filepath.parent].get(filepath.name,0)==0:
+            with open(filepath,"w"):
+                pass
+            logger.info("Creating empty file: %s",filepath)
+        else:
+            logger.info("%s is already exists",filepath.name)
+
+
+if __name__=="__main__":
+    configure_logging()
+    main()
@@ -1,35 +1,226 @@
+import io
 import os
+import copy
+import logging
+import tempfile
+import threading
 import yaml
 from src.datascience import logger
+from src.datascience.utils.uring_io import UringWriter, uring_enabled
 import json
+import orjson
+import pickle
 import joblib
-from ensure import ensure_annotations
+import numpy as np
+import zstandard
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
 from box import ConfigBox
 from pathlib import Path
 from typing import Any
 from box.exceptions import BoxValueError
 
+try:
+    # libyaml C loader, much faster than the pure python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
-@ensure_annotations
-def read_yaml(path_to_yaml: Path) -> ConfigBox:
+
+def _lazy_child(cache: dict, key: Any, value: Any) -> Any:
+    """wraps a nested dict or list on first access, scalars come back as is"""
+    if not isinstance(value, (dict, list)):
+        return value
+    child = cache.get(key)
+    if child is None:
+        child = cache[key] = LazyConfig(value) if isinstance(value, dict) else LazyList(value)
+    return child
+
+
+class LazyConfig(Mapping):
+    """read-only, attribute style view over a dict like ConfigBox, except
+    nested dicts and lists are only wrapped when they are first accessed.
+    The wrapped dict is never copied or modified, so it can be shared"""
+
+    __slots__ = ("_d", "_cache")
+
+    def __init__(self, d: dict):
+        self._d = d
+        self._cache: dict[Any, LazyConfig | LazyList] = {}
+
+    def __getitem__(self, key: Any) -> Any:
+        return _lazy_child(self._cache, key, self._d[key])
+
+    def __getattr__(self, name: str) -> Any:
+        # only reached for names that aren't real attributes, the
+        # underscore guard keeps copy/pickle from recursing on _d
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __iter__(self):
+        return iter(self._d)
+
+    def __len__(self) -> int:
+        return len(self._d)
+
+    def __repr__(self) -> str:
+        return f"LazyConfig({self._d!r})"
+
+
+class LazyList(Sequence):
+    """read-only view over a list inside a LazyConfig, the LazyConfig
+    counterpart of ConfigBox's BoxList: dicts in it get attribute access"""
+
+    __slots__ = ("_l", "_cache")
+
+    def __init__(self, l: list):
+        self._l = l
+        self._cache: dict[int, LazyConfig | LazyList] = {}
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._l)))]
+        if index < 0:
+            index += len(self._l)
+        return _lazy_child(self._cache, index, self._l[index])
+
+    def __len__(self) -> int:
+        return len(self._l)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"LazyList({self._l!r})"
+
+
+def _to_config(content: Any, lazy: bool) -> ConfigBox | LazyConfig:
+    if not lazy:
+        return ConfigBox(content)
+    if not isinstance(content, dict):
+        # same error ConfigBox gives for empty files
+        raise BoxValueError("LazyConfig needs a mapping")
+    return LazyConfig(content)
+
+
+# parsed yaml content keyed by resolved path -> (mtime, size, content)
+# so repeated reads of config/params/schema skip the yaml parse
+_YAML_CACHE: OrderedDict[str, tuple[float, int, Any]] = OrderedDict()
+_YAML_CACHE_MAX = 100
+_YAML_CACHE_LOCK = threading.Lock()
+
+# yaml files at least this big also get a json sidecar next to them,
+# for smaller ones the yaml parse is already cheap
+_YAML_SIDECAR_MIN_SIZE = 1024
+
+
+def _yaml_sidecar_path(path_to_yaml: Path) -> Path:
+    return path_to_yaml.with_suffix(path_to_yaml.suffix + ".cache.json")
+
+
+def _read_yaml_sidecar(path_to_yaml: Path, st: os.stat_result) -> Any:
+    """returns the content stored in the json sidecar, None if missing or stale"""
+    try:
+        with open(_yaml_sidecar_path(path_to_yaml)) as f:
+            sidecar = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(sidecar, dict):
+        return None
+    if sidecar.get("mtime") != st.st_mtime or sidecar.get("size") != st.st_size:
+        return None
+    return sidecar.get("data")
+
+
+def _write_yaml_sidecar(path_to_yaml: Path, st: os.stat_result, content: Any):
+    """atomically writes the parsed yaml content to the json sidecar"""
+    text = json.dumps({"mtime": st.st_mtime, "size": st.st_size, "data": content}, default=str)
+    # json turns non string keys into strings and dates into text, only keep
+    # the sidecar if it gives back exactly what the yaml parse did
+    if json.loads(text)["data"] != content:
+        return
+    sidecar_path = _yaml_sidecar_path(path_to_yaml)
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=sidecar_path.parent, prefix=sidecar_path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(text)
+            os.replace(tmp_path, sidecar_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # read-only location, the sidecar is only an optimisation
+        pass
+
+
+def _open_for_write(path: Path):
+    """binary file to write a large artifact (save_bin, save_arrays) to,
+    io_uring backed when DS_URING=1 on linux"""
+    if uring_enabled():
+        return UringWriter(path)
+    return open(path, "wb")
+
+
+def read_yaml(path_to_yaml: Path | str, lazy: bool = False) -> ConfigBox | LazyConfig:
     """reads yaml file and returns
 
     Args:
         path_to_yaml (str): path like input
+        lazy (bool, optional): return a LazyConfig that wraps nested
+            dicts and lists on access instead of a ConfigBox. It is a
+            read-only view over the cached content, nothing is copied.
+            Defaults to False.
 
     Raises:
         ValueError: if yaml file is empty
         e: empty file
 
     Returns:
-        ConfigBox: ConfigBox type
+        ConfigBox: ConfigBox type (LazyConfig when lazy=True)
     """
+    path_to_yaml = Path(path_to_yaml)
     try:
-        with open(path_to_yaml) as yaml_file:
-            content = yaml.safe_load(yaml_file)
-            # this is how the reading of  the yaml file happens using safe.load
-            logger.info(f"yaml file: {path_to_yaml} loaded successfully")
-            return ConfigBox(content)
+        st = path_to_yaml.stat()
+        key = str(path_to_yaml.resolve())
+        with _YAML_CACHE_LOCK:
+            cached = _YAML_CACHE.get(key)
+            if cached is not None and cached[:2] == (st.st_mtime, st.st_size):
+                # file unchanged since the last read, ConfigBox gets a copy so
+                # callers can't mutate the cached content, LazyConfig is
+                # read-only and can share it
+                _YAML_CACHE.move_to_end(key)
+                logger.info("yaml file: %s loaded from cache", path_to_yaml)
+                return _to_config(cached[2] if lazy else copy.deepcopy(cached[2]), lazy)
+
+        content = None
+        use_sidecar = st.st_size >= _YAML_SIDECAR_MIN_SIZE
+        if use_sidecar:
+            content = _read_yaml_sidecar(path_to_yaml, st)
+
+        if content is None:
+            with open(path_to_yaml) as yaml_file:
+                content = yaml.load(yaml_file, Loader=SafeLoader)
+                # this is how the reading of  the yaml file happens using the safe loader
+            if use_sidecar and content is not None:
+                _write_yaml_sidecar(path_to_yaml, st, content)
+
+        with _YAML_CACHE_LOCK:
+            _YAML_CACHE[key] = (st.st_mtime, st.st_size, content)
+            _YAML_CACHE.move_to_end(key)
+            if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+                _YAML_CACHE.popitem(last=False)
+
+        logger.info("yaml file: %s loaded successfully", path_to_yaml)
+        return _to_config(content if lazy else copy.deepcopy(content), lazy)
     except BoxValueError:
         raise ValueError("yaml file is empty")
     except Exception as e:
@@ -37,78 +228,134 @@ def read_yaml(path_to_yaml: Path) -> ConfigBox:
         
 
 
-@ensure_annotations
-def create_directories(path_to_directories: list, verbose=True):
+def create_directories(path_to_directories: list, verbose: bool = True) -> None:
     """create list of directories
 
     Args:
         path_to_directories (list): list of path of directories
         ignore_log (bool, optional): ignore if multiple dirs is to be created. Defaults to False.
     """
-    for path in path_to_directories:
+    # makedirs on a leaf also creates its parents, so drop every path that
+    # is an ancestor of another one and only create the leaves
+    leaves = []
+    for path in sorted(set(map(os.path.normpath, path_to_directories)), key=len, reverse=True):
+        if not any(leaf.startswith(path.rstrip(os.sep) + os.sep) for leaf in leaves):
+            leaves.append(path)
+
+    for path in leaves:
         os.makedirs(path, exist_ok=True)
-        if verbose:
-            logger.info(f"created directory at: {path}")
-
-@ensure_annotations
-def save_json(path: Path, data: dict):
+    if verbose and logger.isEnabledFor(logging.INFO):
+        logger.info("created %d directories: %s", len(leaves), leaves)
+
+def _has_non_finite(value: Any) -> bool:
+    """True if a NaN or +-inf float sits anywhere in value"""
+    if isinstance(value, (float, np.floating)):
+        return not np.isfinite(value)
+    if isinstance(value, np.ndarray):
+        return value.dtype.kind in "fc" and not np.isfinite(value).all()
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(v) for v in value)
+    return False
+
+
+def _json_default(value: Any) -> Any:
+    # numpy values for the stdlib json fallback, orjson handles them itself
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def save_json(path: Path | str, data: dict) -> None:
     """save json data
 
     Args:
         path (Path): path to json file
         data (dict): data to be saved in json file
     """
-    with open(path, "w") as f:
-        json.dump(data, f, indent=4)
-
-    logger.info(f"json file saved at: {path}")
-    #as we are using the json.dump it will automatically convert the data into json format
+    path = Path(path)
+    # orjson writes bytes straight to the file and handles the numpy
+    # scalars sklearn metrics return, OPT_NON_STR_KEYS turns non string
+    # keys into strings like json.dump did
+    payload = orjson.dumps(
+        data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    )
+    # orjson writes NaN and +-inf as null, an undefined r2 would come back
+    # as None, so fall back to json.dumps which keeps them as NaN/Infinity.
+    # Only looked for when there is a null at all, real Nones are rare here
+    if b"null" in payload and _has_non_finite(data):
+        payload = json.dumps(data, indent=2, default=_json_default).encode()
+    # too small for io_uring to pay off, setting up a ring costs more than the write
+    with open(path, "wb") as f:
+        f.write(payload)
+
+    logger.info("json file saved at: %s", path)
+    #as we are using the orjson.dumps it will automatically convert the data into json format
     #and it will save the data in the json file
     #and it will also log the message that the json file is saved at the path
 
 
-@ensure_annotations
-#this is how the loading of the json file happens using json.load
-def load_json(path: Path) -> ConfigBox:
+#this is how the loading of the json file happens using orjson.loads
+def load_json(path: Path | str, lazy: bool = False) -> ConfigBox | LazyConfig:
     """load json files data
 
     Args:
         path (Path): path to json file
+        lazy (bool, optional): return a LazyConfig instead of a ConfigBox.
+            Defaults to False.
 
     Returns:
         ConfigBox: data as class attributes instead of dict
     """
-    with open(path) as f:
-        content = json.load(f)
+    path = Path(path)
+    with open(path, "rb") as f:
+        raw = f.read()
+    try:
+        content = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # orjson rejects the NaN/Infinity save_json falls back to
+        content = json.loads(raw)
 
-    logger.info(f"json file loaded succesfully from: {path}")
-    return ConfigBox(content)
+    logger.info("json file loaded succesfully from: %s", path)
+    return _to_config(content, lazy)
 
-@ensure_annotations
 # save bin are the binary files that are saved in the file
 # we need them because we are using the joblib to save the binary files
-def save_bin(data: Any, path: Path):
+def save_bin(data: Any, path: Path | str) -> None:
     """save binary file
 
     Args:
         data (Any): data to be saved as binary
         path (Path): path to binary file
     """
-    joblib.dump(value=data, filename=path)
-    logger.info(f"binary file saved at: {path}")
-
-@ensure_annotations
-def load_bin(path: Path) -> Any:
+    path = Path(path)
+    if hasattr(data, "get_params") and hasattr(data, "fit"):
+        logger.warning("save_bin pickles the whole %s, save_estimator stores its fitted arrays instead", type(data).__name__)
+    # uncompressed so load_bin can memory map the numpy arrays in it
+    with _open_for_write(path) as f:
+        joblib.dump(value=data, filename=f, compress=0, protocol=pickle.HIGHEST_PROTOCOL)
+    logger.info("binary file saved at: %s", path)
+
+def load_bin(path: Path | str) -> Any:
     """load binary data
 
+    numpy arrays in the file are memory mapped read-only, so several
+    processes loading the same artifact share its pages. Call .copy() on
+    an array before mutating it.
+
     Args:
         path (Path): path to binary file
 
     Returns:
         Any: object stored in the file
     """
-    data = joblib.load(path)
-    logger.info(f"binary file loaded from: {path}")
+    path = Path(path)
+    try:
+        data = joblib.load(path, mmap_mode="r")
+    except ValueError:
+        data = joblib.load(path)
+    logger.info("binary file loaded from: %s", path)
     return data
     """Nice 👍 this code is a **utility/helper module** that deals with **files, folders, and data persistence** in a structured way. Let me explain it step by step:
 
@@ -122,7 +369,6 @@ import yaml
 from src.datascience import logger
 import json
 import joblib
-from ensure import ensure_annotations
 from box import ConfigBox
 from pathlib import Path
 from typing import Any
@@ -134,7 +380,6 @@ from box.exceptions import BoxValueError
 * **logger** → custom logger from your earlier logging setup (to record events).
 * **json** → to save/load JSON files.
 * **joblib** → for saving/loading binary files (often used for ML models).
-* **ensure\_annotations** → decorator that ensures your function arguments/return types follow type hints.
 * **ConfigBox** → wrapper around dicts so you can access keys like attributes (`config.key` instead of `config["key"]`).
 * **Path** → cleaner way to handle file paths (instead of raw strings).
 * **Any** → type hint (can be any data type).
@@ -145,7 +390,6 @@ from box.exceptions import BoxValueError
 ## 🔹 2. Reading YAML
 
 ```python
-@ensure_annotations
 def read_yaml(path_to_yaml: Path) -> ConfigBox:
     ...
 ```
@@ -185,7 +429,7 @@ def save_json(path: Path, data: dict):
 ```
 
 * Opens a file in write mode.
-* Dumps a dictionary as JSON (`indent=4` for readability).
+* Dumps a dictionary as JSON with `orjson` (indented for readability).
 * Logs success.
 
 👉 **Use case**: Save metadata, experiment results, configs, or reports.
@@ -201,7 +445,7 @@ def load_json(path: Path) -> ConfigBox:
 ```
 
 * Reads JSON file.
-* Loads into a dict with `json.load`.
+* Loads into a dict with `orjson.loads`.
 * Wraps in `ConfigBox` (so you can use dot notation).
 * Logs success.
 
@@ -240,18 +484,17 @@ Without it → same as above, you'd need more manual code.
 
 ---
 
-## 🔹 8. Why `@ensure_annotations`?
+## 🔹 8. Type hints
 
-This decorator ensures that the function arguments and return types follow the type hints you declared.
-Example:
+The type hints on these functions are checked statically (mypy/pyright),
+not at runtime, so calling them costs nothing extra. Paths can be passed
+as `str` or `Path`, the functions convert them with `Path(...)` themselves:
 
 ```python
-read_yaml("config.yaml")  # will fail
+read_yaml("config.yaml")  # works
 read_yaml(Path("config.yaml"))  # works
 ```
 
-👉 This makes your functions **safer and more predictable**.
-
 ---
 
 ## ✅ In Summary
@@ -270,4 +513,108 @@ This code is a **utility toolkit** for a data science project.
 ---
 
 👉 Do you want me to also **show a mini real-world example** of using these utilities in a project (like reading `config.yaml`, creating folders, saving model metadata as JSON, etc.)?
-"""
\ No newline at end of file
+"""
+
+
+def save_arrays(path: Path | str, **arrays: Any) -> None:
+    """save numpy arrays as a zstd compressed npz file
+
+    Args:
+        path (Path): path to the file
+        **arrays: arrays to save, keyed by name
+    """
+    path = Path(path)
+    # np.savez needs a seekable file, so build the npz in memory and
+    # stream it through the compressor
+    buffer = io.BytesIO()
+    np.savez(buffer, **arrays)
+    buffer.seek(0)
+    with _open_for_write(path) as f:
+        zstandard.ZstdCompressor(level=3).copy_stream(buffer, f)
+    logger.info("arrays saved at: %s", path)
+
+
+def load_arrays(path: Path | str) -> dict[str, np.ndarray]:
+    """load arrays saved with save_arrays
+
+    Args:
+        path (Path): path to the file
+
+    Returns:
+        dict: arrays keyed by name
+    """
+    path = Path(path)
+    buffer = io.BytesIO()
+    with open(path, "rb") as f:
+        zstandard.ZstdDecompressor().copy_stream(f, buffer)
+    buffer.seek(0)
+    with np.load(buffer, allow_pickle=False) as npz:
+        arrays = {name: npz[name] for name in npz.files}
+    logger.info("arrays loaded from: %s", path)
+    return arrays
+
+
+def _get_params_arrays(est: Any) -> dict[str, np.ndarray]:
+    """fitted attributes of a sklearn estimator (coef_, intercept_, ...) as arrays
+
+    Raises:
+        TypeError: if a fitted attribute can't be stored as an array, or the
+            estimator has no fitted attributes at all (e.g. a Pipeline)
+    """
+    arrays = {}
+    for name, value in vars(est).items():
+        if not name.endswith("_") or name.startswith("_"):
+            continue
+        if not isinstance(value, (np.ndarray, np.generic, int, float, str)):
+            raise TypeError(
+                f"{type(est).__name__}.{name} is a {type(value).__name__} and can't be "
+                "stored by save_estimator, use save_bin for this estimator"
+            )
+        value = np.asarray(value)
+        if value.dtype == object:
+            # e.g. feature_names_in_, saved as text so no pickle is needed
+            value = value.astype(str)
+        arrays[name] = value
+    if not arrays:
+        raise TypeError(
+            f"{type(est).__name__} has no fitted array attributes to store, "
+            "use save_bin for this estimator"
+        )
+    return arrays
+
+
+def save_estimator(est: Any, path: Path | str) -> None:
+    """save the fitted arrays of a sklearn estimator with save_arrays
+
+    Only the learned attributes are stored, not the hyperparameters or the
+    class, load them back with load_estimator into an estimator built with
+    the same parameters. Estimators whose fitted state isn't plain arrays
+    (ensembles, pipelines, ...) are refused, save those with save_bin.
+
+    Args:
+        est (Any): fitted sklearn estimator
+        path (Path): path to the file
+
+    Raises:
+        TypeError: if the estimator can't be stored as arrays, nothing is written
+    """
+    save_arrays(path, **_get_params_arrays(est))
+
+
+def load_estimator(est: Any, path: Path | str) -> Any:
+    """restore fitted arrays saved by save_estimator onto `est`
+
+    Args:
+        est (Any): unfitted estimator with the same parameters as the saved one
+        path (Path): path to the file
+
+    Returns:
+        Any: the fitted estimator
+    """
+    for name, value in load_arrays(path).items():
+        if value.ndim == 0:
+            value = value.item()
+        elif value.dtype.kind == "U":
+            value = value.astype(object)
+        setattr(est, name, value)
+    return est
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import ElasticNet
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+from src.datascience.utils import common
+from src.datascience.utils.common import load_estimator, load_json, read_yaml, save_estimator, save_json
+
+
+@pytest.fixture
+def xy():
+    rng = np.random.RandomState(0)
+    return rng.rand(50, 4), rng.rand(50)
+
+
+def test_estimator_round_trip(tmp_path, xy):
+    x, y = xy
+    model = ElasticNet(alpha=0.2, l1_ratio=0.1).fit(x, y)
+    path = tmp_path / "model.npz.zst"
+
+    save_estimator(model, path)
+    restored = load_estimator(ElasticNet(alpha=0.2, l1_ratio=0.1), path)
+
+    np.testing.assert_allclose(restored.predict(x), model.predict(x))
+
+
+@pytest.mark.parametrize(
+    "model, attribute",
+    [
+        (RandomForestRegressor(n_estimators=3, random_state=0), r"RandomForestRegressor\.estimator_ is a DecisionTreeRegressor"),
+        (make_pipeline(StandardScaler(), ElasticNet()), "no fitted array attributes"),
+    ],
+)
+def test_save_estimator_refuses_unsupported(tmp_path, xy, model, attribute):
+    x, y = xy
+    model.fit(x, y)
+    path = tmp_path / "model.npz.zst"
+
+    with pytest.raises(TypeError, match=attribute):
+        save_estimator(model, path)
+    assert not path.exists()
+
+
+def test_save_json_accepts_non_str_keys(tmp_path):
+    path = tmp_path / "data.json"
+
+    save_json(path, {1: 2, "rmse": np.float64(0.5)})
+
+    assert load_json(path) == {"1": 2, "rmse": 0.5}
+
+
+def test_save_json_keeps_non_finite_floats(tmp_path):
+    path = tmp_path / "metrics.json"
+
+    save_json(path, {"r2": float("nan"), "rmse": np.float64("inf"), "mae": np.float32(0.5), "note": None})
+
+    assert b"NaN" in path.read_bytes()
+    metrics = load_json(path)
+    assert np.isnan(metrics.r2)
+    assert metrics.rmse == float("inf")
+    assert metrics.mae == 0.5
+    assert metrics.note is None
+
+
+def test_read_yaml_lazy_shares_the_cached_content(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("stages:\n  - name: ingest\n    dirs: [a, b]\nseed: 1\n")
+
+    cfg = read_yaml(path, lazy=True)
+
+    assert cfg._d is common._YAML_CACHE[str(path.resolve())][2]
+    assert cfg.stages[0].name == "ingest"
+    assert cfg.stages[-1].dirs == ["a", "b"]
+    assert read_yaml(path).stages[0].name == "ingest"
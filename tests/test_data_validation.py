@@ -0,0 +1,42 @@
+import pandas as pd
+import pytest
+import yaml
+
+from src.datascience.components.data_validation import DataValiadtion
+from src.datascience.entity.config_entity import DataValidationConfig
+
+DATA = "artifacts/data_ingestion/winequality-red.csv"
+
+
+@pytest.fixture
+def schema():
+    with open("schema.yaml") as f:
+        return yaml.safe_load(f)["COLUMNS"]
+
+
+def _validate(tmp_path, schema, data_path):
+    config = DataValidationConfig(
+        root_dir=tmp_path,
+        STATUS_FILE=str(tmp_path / "status.txt"),
+        unzip_data_dir=data_path,
+        all_schema=schema,
+        schema_columns=frozenset(schema),
+    )
+    return DataValiadtion(config).validate_all_columns()
+
+
+def test_valid_data_passes(tmp_path, schema):
+    assert _validate(tmp_path, schema, DATA) is True
+    assert (tmp_path / "status.txt").read_text() == "Validation status: True"
+
+
+def test_value_checks_follow_schema_yaml(tmp_path, schema):
+    data = pd.read_csv(DATA)
+    data["quality"] = data["quality"].astype(float)
+    data.loc[3, "quality"] = 5.5
+    path = tmp_path / "data.csv"
+    data.to_csv(path, index=False)
+
+    assert _validate(tmp_path, schema, path) is False
+    # the same values pass once the schema says the column is a float
+    assert _validate(tmp_path, {**schema, "quality": "float64"}, path) is True
@@ -0,0 +1,21 @@
+import time
+
+import src.datascience as datascience
+
+
+def test_exception_traceback_follows_the_record(tmp_path):
+    datascience.configure_logging(log_dir=str(tmp_path))
+    try:
+        1 / 0
+    except ZeroDivisionError as e:
+        datascience.logger.exception(e)
+
+    # the listener thread writes the record, errors are flushed right away
+    log_file = tmp_path / "logging.log"
+    deadline = time.monotonic() + 5
+    while "ZeroDivisionError: division by zero\n" not in log_file.read_text() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    text = log_file.read_text()
+    assert "ERROR: test_logging: division by zero]\nTraceback (most recent call last):" in text
+    assert text.endswith("ZeroDivisionError: division by zero\n")
@@ -0,0 +1,75 @@
+import sys
+
+import numpy as np
+import pytest
+
+from src.datascience.utils import uring_io
+from src.datascience.utils.common import _open_for_write, load_arrays, load_bin, save_arrays, save_bin
+
+pytestmark = pytest.mark.skipif(
+    sys.platform != "linux" or uring_io.liburing is None, reason="needs linux and liburing"
+)
+
+
+@pytest.fixture
+def uring(monkeypatch):
+    monkeypatch.setenv("DS_URING", "1")
+    assert uring_io.uring_enabled()
+
+
+def test_writer_matches_plain_write(tmp_path):
+    # small writes through the buffer, then one big enough to bypass it
+    parts = [b"header", bytes(range(256)) * 10, np.arange(1_500_000, dtype=np.float64).tobytes(), b"tail"]
+    path = tmp_path / "out.bin"
+
+    with uring_io.UringWriter(path) as f:
+        for part in parts:
+            f.write(part)
+        assert f.tell() == sum(map(len, parts))
+
+    assert path.read_bytes() == b"".join(parts)
+
+
+def test_writer_reaps_every_completion_once_the_cq_wraps(tmp_path):
+    # 20 chunks leave a batch of 4 behind, so the CQ head is no longer
+    # aligned when the following full batches are reaped
+    chunk = uring_io._CHUNK_SIZE
+    rng = np.random.RandomState(0)
+    parts = [rng.bytes(20 * chunk)] + [rng.bytes(16 * chunk) for _ in range(3)]
+    path = tmp_path / "out.bin"
+
+    with uring_io.UringWriter(path) as f:
+        for part in parts:
+            f.write(part)
+
+    assert f.completions == 20 + 3 * 16
+    assert path.read_bytes() == b"".join(parts)
+
+
+def test_save_bin_round_trip(tmp_path, uring, monkeypatch):
+    data = {"weights": np.random.RandomState(0).rand(1_000_000), "name": "model"}
+    path = tmp_path / "model.joblib"
+
+    with _open_for_write(tmp_path / "probe") as f:
+        assert isinstance(f, uring_io.UringWriter)
+    save_bin(data, path)
+    loaded = load_bin(path)
+
+    np.testing.assert_array_equal(loaded["weights"], data["weights"])
+    assert loaded["name"] == "model"
+
+    monkeypatch.delenv("DS_URING")
+    save_bin(data, tmp_path / "plain.joblib")
+    assert path.read_bytes() == (tmp_path / "plain.joblib").read_bytes()
+
+
+def test_save_arrays_round_trip(tmp_path, uring):
+    arrays = {"a": np.arange(10), "b": np.eye(3)}
+    path = tmp_path / "arrays.npz.zst"
+
+    save_arrays(path, **arrays)
+    loaded = load_arrays(path)
+
+    assert loaded.keys() == arrays.keys()
+    for name, value in arrays.items():
+        np.testing.assert_array_equal(loaded[name], value)